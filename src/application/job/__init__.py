@@ -1,6 +1,6 @@
 """Job implementations for the game bot."""
 
-from src.application.job.job import Job, JobStatus
+from src.application.job.job import Job, JobKind, JobStatus
 from src.application.job.build_job import BuildJob
 from src.application.job.build_new_job import BuildNewJob
 from src.application.job.hero_adventure_job import HeroAdventureJob
@@ -13,6 +13,7 @@ from src.application.job.scheduler import ScheduledJobQueue
 
 __all__ = [
     "Job",
+    "JobKind",
     "JobStatus",
     "BuildJob",
     "BuildNewJob",
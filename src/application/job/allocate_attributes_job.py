@@ -1,13 +1,14 @@
 from dataclasses import dataclass
 
 from src.domain.config import HeroConfig
-from src.application.job.job import Job
+from src.application.job.job import Job, JobKind
 from src.domain.protocols.driver_protocol import DriverProtocol
 from src.domain.model.model import DEFAULT_ATTRIBUTE_POINT_TYPE, AttributePointType, HeroAttributes, HeroInfo
 
 
 @dataclass(kw_only=True)
 class AllocateAttributesJob(Job):
+    kind = JobKind.ALLOCATE_ATTRIBUTES
     points: int
     hero_info: HeroInfo
     hero_config: HeroConfig
@@ -3,7 +3,7 @@ from datetime import datetime
 import logging
 
 from src.domain.model.model import Resources
-from src.application.job.job import Job
+from src.application.job.job import Job, JobKind
 from src.domain.protocols.driver_protocol import DriverProtocol
 from src.infrastructure.scan_adapter.scanner_adapter import Scanner
 
@@ -12,6 +12,7 @@ logger = logging.getLogger(__name__)
 
 @dataclass(kw_only=True)
 class BuildJob(Job):
+    kind = JobKind.BUILD
     village_name: str
     village_id: int
     building_id: int
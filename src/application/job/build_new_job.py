@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 
-from src.application.job.job import Job
+from src.application.job.job import Job, JobKind
 from src.domain.model.model import Resources
 from src.domain.protocols.driver_protocol import DriverProtocol
 import logging
@@ -10,6 +10,7 @@ logger = logging.getLogger(__name__)
 
 @dataclass(kw_only=True)
 class BuildNewJob(Job):
+    kind = JobKind.BUILD_NEW
     village_name: str
     village_id: int
     building_id: int
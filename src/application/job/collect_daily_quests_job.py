@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from src.application.job.job import Job
+from src.application.job.job import Job, JobKind
 from src.domain.protocols.driver_protocol import DriverProtocol
 
 DAILY_QUESTS_SELECTOR = '#navigation a.dailyQuests'
@@ -12,6 +12,7 @@ ACHIEVED_POINTS_SELECTOR = ".achievedPoints .achieved"
 
 @dataclass(kw_only=True)
 class CollectDailyQuestsJob(Job):
+    kind = JobKind.COLLECT_DAILY_QUESTS
     daily_quest_threshold: int
 
     def execute(self, driver: DriverProtocol) -> bool:
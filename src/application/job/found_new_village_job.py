@@ -1,12 +1,13 @@
 from dataclasses import dataclass
 
-from src.application.job.job import Job
+from src.application.job.job import Job, JobKind
 from src.domain.model.village import Village
 from src.domain.protocols.driver_protocol import DriverProtocol
 
 
 @dataclass(kw_only=True)
 class FoundNewVillageJob(Job):
+    kind = JobKind.FOUND_NEW_VILLAGE
     village: Village
 
     def execute(self, driver: DriverProtocol) -> bool:
@@ -1,11 +1,12 @@
 import logging
 
-from src.application.job.job import Job
+from src.application.job.job import Job, JobKind
 from src.domain.protocols.driver_protocol import DriverProtocol
 
 logger = logging.getLogger(__name__)
 
 class HeroAdventureJob(Job):
+    kind = JobKind.HERO_ADVENTURE
 
     def execute(self, ctx: AdventureContext) -> None:
         state = NavigatingState()
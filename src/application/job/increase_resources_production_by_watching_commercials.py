@@ -1,7 +1,7 @@
 import logging
 from dataclasses import dataclass
 
-from src.application.job import Job
+from src.application.job.job import Job, JobKind
 from src.domain.protocols.driver_protocol import DriverProtocol
 
 
@@ -9,6 +9,7 @@ logger = logging.getLogger(__name__)
 
 @dataclass(kw_only=True)
 class IncreaseResourcesProductionByWatchingCommercialsJob(Job):
+    kind = JobKind.WATCH_COMMERCIALS
 
     def execute(self, driver: DriverProtocol) -> bool:
         """Watch commercials to increase resources production for 1 hour.
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from typing import ClassVar
 import uuid
 
 from src.domain.protocols.driver_protocol import DriverProtocol
@@ -15,8 +16,24 @@ class JobStatus(Enum):
     EXPIRED = "expired"
 
 
+class JobKind(Enum):
+    BUILD = "build"
+    BUILD_NEW = "build_new"
+    TRAIN = "train"
+    PLANNING = "planning"
+    HERO_ADVENTURE = "hero_adventure"
+    ALLOCATE_ATTRIBUTES = "allocate_attributes"
+    COLLECT_DAILY_QUESTS = "collect_daily_quests"
+    COLLECT_QUESTMASTER = "collect_questmaster"
+    FOUND_NEW_VILLAGE = "found_new_village"
+    WATCH_COMMERCIALS = "watch_commercials"
+
+
 @dataclass(kw_only=True)
 class Job(ABC):
+    # Set by every concrete job; lets callers filter jobs by a plain attribute compare
+    kind: ClassVar[JobKind]
+
     job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     scheduled_time: datetime
     success_message: str
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Protocol
 
-from src.application.job.job import Job
+from src.application.job.job import Job, JobKind
 from src.domain.protocols.driver_protocol import DriverProtocol
 
 
@@ -12,6 +12,7 @@ class PlanningContext(Protocol):
 
 @dataclass(kw_only=True)
 class PlanningJob(Job):
+    kind = JobKind.PLANNING
     planning_context: PlanningContext
 
     def execute(self, driver: DriverProtocol) -> bool:
@@ -1,7 +1,7 @@
 import logging
 from dataclasses import dataclass
 
-from src.application.job.job import Job
+from src.application.job.job import Job, JobKind
 from src.domain.protocols.driver_protocol import DriverProtocol
 
 logger = logging.getLogger(__name__)
@@ -9,6 +9,7 @@ logger = logging.getLogger(__name__)
 
 @dataclass(kw_only=True)
 class TrainJob(Job):
+    kind = JobKind.TRAIN
     village_id: int
     military_building_id: int
     troop_type: int
@@ -70,6 +70,11 @@ TRAININT_SPEEDS = {
     20: 14,
 }
 
+# training time multipliers indexed directly by building level (index 0 is unused)
+TRAINING_TIME_MULTIPLIERS: tuple[float, ...] = (0.0,) + tuple(
+    TRAININT_SPEEDS[level] / 100.0 for level in range(1, len(TRAININT_SPEEDS) + 1)
+)
+
 BUILDINGS_DATA = [
     {"gid": 1, "name": "Woodcutter", "cost": [40, 100, 50, 60], "k": 1.67, "time": TimeT3(1780/3, 1.6, 1000/3)},
     {"gid": 2, "name": "Clay Pit", "cost": [80, 40, 80, 50], "k": 1.67, "time": TimeT3(1660/3, 1.6, 1000/3)},
@@ -333,8 +338,7 @@ class TravianCalculator:
         if building_level > 20:
             building_level = 20
 
-        # Get speed multiplier from TRAININT_SPEEDS
-        speed_multiplier = TRAININT_SPEEDS.get(building_level, 100) / 100.0
+        speed_multiplier = TRAINING_TIME_MULTIPLIERS[building_level]
 
         # Calculate actual training time
         actual_time = unit_training_time_seconds * speed_multiplier / self.speed
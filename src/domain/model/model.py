@@ -45,7 +45,7 @@ class TileAbandonedValley(Tile):
     field_type: str = ""  # Translated: "5-4-3-6"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Resources:
     lumber: int | float = 0
     clay: int | float = 0
@@ -56,6 +56,14 @@ class Resources:
         """Calculate the total of all resource types."""
         return self.lumber + self.clay + self.iron + self.crop
 
+    def as_tuple(self) -> tuple[int | float, int | float, int | float, int | float]:
+        """Return the amounts in fixed order: lumber, clay, iron, crop."""
+        return self.lumber, self.clay, self.iron, self.crop
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Return the amounts keyed by resource name (lumber, clay, iron, crop)."""
+        return {"lumber": self.lumber, "clay": self.clay, "iron": self.iron, "crop": self.crop}
+
     def __sub__(self, other):
         return Resources(
             lumber=self.lumber - other.lumber,
@@ -110,10 +118,15 @@ class Resources:
             crop=self.crop // other.crop if other.crop > 0 else float('inf')
         )
 
-    def count_how_many_can_be_made(self, cost: "Resources") -> float:
-        division_result = self / cost
-        values = [division_result.lumber, division_result.clay, division_result.iron, division_result.crop]
-        return int(min(values))
+    def count_how_many_can_be_made(self, cost: "Resources") -> int:
+        """Count how many items of the given cost can be paid for with these resources.
+
+        Resource types the item does not cost are ignored; an item without any cost yields 0.
+        """
+        return int(min(
+            (amount / price for amount, price in zip(self.as_tuple(), cost.as_tuple()) if price > 0),
+            default=0,
+        ))
 
     def min(self):
         return min(self.lumber, self.clay, self.iron, self.crop)
@@ -141,8 +154,8 @@ class Resources:
 
     def is_disjoint(self, other: "Resources") -> bool:
         """Return True if there is no overlap in positive resources between self and other."""
-        for source_type, value in vars(self).items():
-            if value > 0 and getattr(other, source_type) > 0:
+        for value, other_value in zip(self.as_tuple(), other.as_tuple()):
+            if value > 0 and other_value > 0:
                 return False
         return True
 
@@ -169,7 +182,7 @@ class BuildingCost:
     time_seconds: int
     time_formatted: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BuildingContract:
     resources: Resources
     crop_consumption: int
@@ -238,7 +251,7 @@ class ReservationResponse:
     provided_resources: Resources
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HeroAttributes:
     fighting_strength: int = 0
     off_bonus: int = 0
@@ -246,7 +259,7 @@ class HeroAttributes:
     production_points: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class HeroInfo:
     health: int
     experience: int
@@ -416,10 +429,13 @@ class BuildingType(Enum):
 
     @classmethod
     def from_gid(cls, gid: int):
-        for member in cls:
-            if member.gid == gid:
-                return member
-        raise ValueError(f"No {cls.__name__} with gid {gid}")
+        member = BUILDING_TYPE_BY_GID.get(gid)
+        if member is None:
+            raise ValueError(f"No {cls.__name__} with gid {gid}")
+        return member
+
+
+BUILDING_TYPE_BY_GID = {member.gid: member for member in BuildingType}
 
 economy_building_types = {
     BuildingType.WOODCUTTER,
@@ -447,13 +463,16 @@ class ResourceType(Enum):
 
     @staticmethod
     def find_by_gid(gid: int) -> "ResourceType":
-        for member in ResourceType:
-            if member.gid == gid:
-                return member
-        raise ValueError(f"No ResourceType with id: {gid}")
+        member = RESOURCE_TYPE_BY_GID.get(gid)
+        if member is None:
+            raise ValueError(f"No ResourceType with id: {gid}")
+        return member
 
 
-@dataclass
+RESOURCE_TYPE_BY_GID = {member.gid: member for member in ResourceType}
+
+
+@dataclass(frozen=True, slots=True)
 class Building:
     id: int | None # None for future buildings not yet built
     level: int
@@ -464,7 +483,7 @@ class Building:
         return self.level == self.type.max_level
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResourcePit:
     id: int
     type: ResourceType
@@ -481,14 +500,14 @@ class Tribe(Enum):
     EGYPTIANS = 7
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BuildingJob:
     building_name: str
     target_level: int
     time_remaining: int
     job_id: str | None = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VillageBasicInfo:
     id: int
     name: str
@@ -496,7 +515,7 @@ class VillageBasicInfo:
     coordinate_y: int
     is_under_attack: bool = False
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IncomingAttackInfo:
     attack_count: int = 0
     next_attack_seconds: int | None = None
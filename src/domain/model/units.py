@@ -4,7 +4,7 @@ from enum import Enum
 from src.domain.model.model import Resources, BuildingType, Tribe
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Unit:
     """
     Represents a Travian unit with its stats, costs, and training requirements.
@@ -58,7 +58,24 @@ PHALANXES = Unit(
 )
 
 
-def get_units_for_tribe(tribe: Tribe) -> list[Unit]:
+UNITS_BY_TRIBE: dict[Tribe, tuple[Unit, ...]] = {
+    Tribe.ROMANS: (LEGIONNAIRE,),
+    Tribe.GAULS: (PHALANXES,),
+    Tribe.TEUTONS: (),
+    Tribe.HUNS: (),
+    Tribe.SPARTANS: (),
+    Tribe.NORS: (),
+    Tribe.EGYPTIANS: (),
+}
+
+UNIT_BY_TRIBE_AND_NAME: dict[tuple[Tribe, str], Unit] = {
+    (tribe, unit.name): unit
+    for tribe, units in UNITS_BY_TRIBE.items()
+    for unit in units
+}
+
+
+def get_units_for_tribe(tribe: Tribe) -> tuple[Unit, ...]:
     """
     Get all units available for a specific tribe.
     
@@ -66,18 +83,9 @@ def get_units_for_tribe(tribe: Tribe) -> list[Unit]:
         tribe: The tribe to get units for
         
     Returns:
-        List of Unit objects available for the tribe
+        Tuple of Unit objects available for the tribe
     """
-    units_by_tribe: dict[Tribe, list[Unit]] = {
-        Tribe.ROMANS: [LEGIONNAIRE],
-        Tribe.GAULS: [PHALANXES],
-        Tribe.TEUTONS: [],
-        Tribe.HUNS: [],
-        Tribe.SPARTANS: [],
-        Tribe.NORS: [],
-        Tribe.EGYPTIANS: [],
-    }
-    return units_by_tribe.get(tribe, [])
+    return UNITS_BY_TRIBE.get(tribe, ())
 
 
 def get_unit_by_name(unit_name: str, tribe: Tribe) -> Unit | None:
@@ -91,7 +99,4 @@ def get_unit_by_name(unit_name: str, tribe: Tribe) -> Unit | None:
     Returns:
         Unit object if found, None otherwise
     """
-    for unit in get_units_for_tribe(tribe):
-        if unit.name == unit_name:
-            return unit
-    return None
+    return UNIT_BY_TRIBE_AND_NAME.get((tribe, unit_name))
@@ -11,7 +11,7 @@ from src.domain.model.model import Resources, Tribe, BuildingQueue, scan_contrac
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Village:
     id: int
     name: str
@@ -1,5 +1,6 @@
 import logging
 
+from src.application.job import Job
 from src.domain.config import LogicConfig, HeroConfig, Strategy as StrategyType
 from src.domain.calculator.calculator import TravianCalculator
 from src.domain.model.game_state import GameState
@@ -29,3 +30,6 @@ class LogicEngine:
     def plan(self, game_state: GameState):
         return self.strategy.plan_jobs(game_state, self.calculator)
 
+    def plan_all(self, game_states: list[GameState]) -> list[list[Job]]:
+        """Plan jobs for each game state, in input order."""
+        return [self.plan(game_state) for game_state in game_states]
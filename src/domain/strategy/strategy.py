@@ -1,5 +1,8 @@
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Protocol
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
 import math
 
@@ -19,6 +22,19 @@ from src.application.job import HeroAdventureJob, AllocateAttributesJob, Collect
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _trainable_units_per_hour(tribe: Tribe, hourly_production: Resources) -> Mapping[str, int]:
+    """Memoized unit name to count mapping; Resources is frozen, so production is a valid cache key.
+
+    The mapping is a read-only view, so the cached result can be handed out directly.
+    """
+    return MappingProxyType({
+        unit.name: units_trainable
+        for unit in get_units_for_tribe(tribe)
+        if (units_trainable := hourly_production.count_how_many_can_be_made(unit.costs)) > 0
+    })
+
+
 class Strategy(Protocol):
 
     def __init__(self, logic_config: LogicConfig, hero_config: HeroConfig):
@@ -49,17 +65,7 @@ class Strategy(Protocol):
         :param village_troops: Dictionary mapping unit name to quantity
         :return: Total attack value
         """
-        if not village_troops:
-            return 0
-
-        attack = 0
-        for unit_name, quantity in village_troops.items():
-            unit = get_unit_by_name(unit_name, tribe)
-
-            if unit:
-                attack += unit.attack * quantity
-
-        return attack
+        return self.calculate_troops_statistics(tribe, village_troops)['attack']
 
     def total_defense_infantry(self, village_troops: dict[str, int], tribe: Tribe) -> int:
         """
@@ -68,17 +74,7 @@ class Strategy(Protocol):
         :param village_troops: Dictionary mapping unit name to quantity
         :return: Total defense against infantry value
         """
-        if not village_troops:
-            return 0
-
-        total_defense = 0
-        for unit_name, quantity in village_troops.items():
-            # Try to find the unit in all tribes
-            unit = get_unit_by_name(unit_name, tribe)
-            if unit:
-                total_defense += unit.defense_vs_infantry * quantity
-
-        return total_defense
+        return self.calculate_troops_statistics(tribe, village_troops)['defense_infantry']
 
     def total_defense_cavalry(self, village_troops: dict[str, int], tribe: Tribe) -> int:
         """
@@ -88,17 +84,7 @@ class Strategy(Protocol):
         :param tribe: The tribe of the village (used to find units)
         :return: Total defense against cavalry value
         """
-        if not village_troops:
-            return 0
-
-        defense = 0
-        for unit_name, quantity in village_troops.items():
-            # Try to find the unit in all tribes
-            unit = get_unit_by_name(unit_name, tribe)
-            if unit:
-                defense += unit.defense_vs_cavalry * quantity
-
-        return defense
+        return self.calculate_troops_statistics(tribe, village_troops)['defense_cavalry']
 
     def grain_consumption_per_hour(self, village_troops: dict[str, int], tribe: Tribe) -> int:
         """
@@ -107,40 +93,22 @@ class Strategy(Protocol):
         :param village_troops: Dictionary mapping unit name to quantity
         :return: Total grain consumption per hour
         """
-        if not village_troops:
-            return 0
-
-        total_consumption = 0
-        for unit_name, quantity in village_troops.items():
-            # Try to find the unit in all tribes
-            unit = get_unit_by_name(unit_name, tribe)
+        return self.calculate_troops_statistics(tribe, village_troops)['grain_consumption']
 
-            if unit:
-                total_consumption += unit.grain_consumption * quantity
-
-        return total_consumption
-
-    def estimate_trainable_units_per_hour(self, village_tribe: Tribe, hourly_production: Resources) -> dict[str, int]:
+    def estimate_trainable_units_per_hour(self, village_tribe: Tribe, hourly_production: Resources) -> Mapping[str, int]:
         # This method should treat differently units trained in barracks and stable,
         # because we can train one in barrack and one in stable
         # At this moment this method calculate only one unit from barracks,
         # but in future we need to compare units and choose best option or mix option
 
-        trainable_units: dict[str, int] = {}
-        
-        units = get_units_for_tribe(village_tribe)
-        if not units:
-            return trainable_units
+        return _trainable_units_per_hour(village_tribe, hourly_production)
 
-        for unit in units:
-            # Calculate how many units can be trained based on available resources
-            units_trainable = hourly_production.count_how_many_can_be_made(unit.costs)
-            if units_trainable > 0:
-                trainable_units[unit.name] = units_trainable.__int__()
-
-        return trainable_units
+    def calculate_troops_statistics(self, tribe: Tribe, units: Mapping[str, int]) -> dict[str, int]:
+        """
+        Calculate attack, both defenses and grain consumption of the given units in a single pass.
 
-    def calculate_troops_statistics(self, tribe: Tribe, units: dict[str, int]) -> dict[str, int]:
+        Prefer this over the per-statistic helpers when more than one value is needed.
+        """
         statistics = {
             'attack': 0,
             'defense_infantry': 0,
@@ -10,6 +10,7 @@ from src.domain.config import Config, HeroConfig, HeroAdventuresConfig, HeroReso
     LogicConfig, Strategy, DriverConfig
 
 CONFIG_FILENAME = "config.yaml"
+ENV_VAR_PATTERN = re.compile(r'\$\{(\w+)}')
 
 def find_config_path() -> str:
     """Find the most appropriate config.yaml path.
@@ -108,7 +109,7 @@ def _read_config(file: Path) -> dict[str, Any]:
         var_name = match.group(1)
         return os.getenv(var_name, match.group(0))
 
-    content = re.sub(r'\$\{(\w+)}', replace_env_var, content)
+    content = ENV_VAR_PATTERN.sub(replace_env_var, content)
 
     data = yaml.safe_load(content)
     return data
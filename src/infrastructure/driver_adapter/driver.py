@@ -1,5 +1,7 @@
 import logging
 import random
+import re
+import sys
 from typing import Iterable
 
 from playwright.sync_api import Playwright, Locator
@@ -67,6 +69,14 @@ POPULATION_MARKER = "{k.einwohner}"
 PLAYER_MARKER = "{k.spieler}"
 ALLIANCE_MARKER = "{k.allianz}"
 ANIMALS_MARKER = "{k.animals}"
+# Common prefix of the markers above; titles without it and without a player are decorative
+TILE_MARKER_PREFIX = "{k."
+
+# Field type code (e.g. "f3") inside a tile title such as "{k.vt} {k.f3}"
+FIELD_TYPE_PATTERN = re.compile(r'\{k\.(f\d+)\}')
+
+# Animal unit id and count pairs inside the animals section of an oasis tooltip
+ANIMAL_UNIT_PATTERN = re.compile(r'unit u(\d+).*?value[^>]*>(\d+)')
 
 logger = logging.getLogger(__name__)
 
@@ -205,7 +215,7 @@ class Driver(DriverProtocol):
     def transfer_resources_from_hero(self, support: Resources):
         self.navigate(HERO_INVENTORY)
 
-        for item_id, amount in vars(support).items():
+        for item_id, amount in support.as_dict().items():
             if amount > 0:
                 self.transfer_resource(amount, item_id)
 
@@ -330,15 +340,21 @@ class Driver(DriverProtocol):
         self.navigate(f"/karte.php?fullscreen=1&x={coordinates[0]}&y={coordinates[1]}&zoom=1")
 
         position = self.catch_response("position")
-        tiles = position.get("tiles", [])
+        return self._parse_tiles(position.get("tiles", []))
+
+    @staticmethod
+    def _parse_tiles(tiles: list[dict]) -> list[Tile]:
+        """
+        Parse all tiles of a map response in one pass, dropping decorative ones.
 
-        map_tiles: list[Tile] = []
-        for tile in tiles:
-            parsed_tile = self._parse_tile(tile)
-            if parsed_tile:
-                map_tiles.append(parsed_tile)
+        Args:
+            tiles: List of tile dictionaries from the game API
 
-        return map_tiles
+        Returns:
+            Parsed Tile objects in the order they appear in the response
+        """
+        parse_tile = Driver._parse_tile
+        return [parsed_tile for tile in tiles if (parsed_tile := parse_tile(tile)) is not None]
 
     @staticmethod
     def _parse_tile(tile: dict) -> Tile | None:
@@ -352,9 +368,15 @@ class Driver(DriverProtocol):
             Tile object (TileVillage, TileOasisFree, TileOasisOccupied, or TileAbandonedValley) or None if parsing fails
         """
         title = tile.get("title", "")
+
+        # Decorative elements ("Forest", "Lake", empty title) carry no marker and no player
+        if TILE_MARKER_PREFIX not in title and tile.get("uid") is None:
+            return None
+
         text = tile.get("text", "")
-        x_coord = tile.get("position", {}).get("x", 0)
-        y_coord = tile.get("position", {}).get("y", 0)
+        position = tile.get("position") or {}
+        x_coord = position.get("x", 0)
+        y_coord = position.get("y", 0)
 
         if Driver._is_free_oasis(tile, title):
             return Driver._create_free_oasis(x_coord, y_coord, text)
@@ -436,15 +458,12 @@ class Driver(DriverProtocol):
     @staticmethod
     def _extract_and_translate_field_type(title: str) -> str:
         """Extract field type code from title and translate to human-readable format."""
-        if FIELD_TYPE_MARKER not in title:
+        match = FIELD_TYPE_PATTERN.search(title)
+        if not match:
             return ""
 
-        try:
-            field_part = title.split(FIELD_TYPE_MARKER)[1].split("}")[0]
-            field_code = f"f{field_part}"
-            return FIELD_TYPE_TRANSLATIONS.get(field_code, field_code)
-        except (IndexError, ValueError):
-            return ""
+        field_code = match.group(1)
+        return FIELD_TYPE_TRANSLATIONS.get(field_code, field_code)
 
     @staticmethod
     def _extract_resource_bonus(text: str) -> str:
@@ -470,8 +489,7 @@ class Driver(DriverProtocol):
             # Find all animal units in the text
             animal_section = text.split(ANIMALS_MARKER)[1]
             # Extract unit types and counts using simple parsing
-            import re
-            units = re.findall(r'unit u(\d+).*?value[^>]*>(\d+)', animal_section)
+            units = ANIMAL_UNIT_PATTERN.findall(animal_section)
             for unit_id, count in units:
                 unit_code = f"u{unit_id}"
                 animal_name = ANIMAL_TRANSLATIONS.get(unit_code, unit_code)
@@ -483,10 +501,13 @@ class Driver(DriverProtocol):
 
     @staticmethod
     def _extract_tribe(title: str) -> str:
-        """Extract tribe information from title."""
+        """Extract tribe information from title.
+
+        Only a handful of tribe names exist, so they are interned to share one string per tribe across all tiles.
+        """
         if TRIBE_MARKER not in title:
             return ""
-        return title.split(TRIBE_MARKER)[1].strip()
+        return sys.intern(title.split(TRIBE_MARKER)[1].strip())
 
     @staticmethod
     def _extract_population(text: str) -> int:
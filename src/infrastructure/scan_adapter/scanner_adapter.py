@@ -8,8 +8,11 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Callable
+from functools import lru_cache
 
-from bs4 import Tag, BeautifulSoup
+import soupsieve
+from bs4 import Tag, BeautifulSoup, SoupStrainer
 
 CLASS_TO_RESOURCE_MAP = {
     "item145": "lumber",
@@ -32,7 +35,41 @@ from src.domain.model.model import (
 from src.domain.model.village import Village
 from src.domain.protocols.scanner_protocol import ScannerProtocol
 
-HTML_PARSER = 'html.parser'
+HTML_PARSER = 'lxml'
+
+
+def _has_class_token(class_name: str) -> Callable[[str | None], bool]:
+    """Match a raw class attribute by token; at parse time strainers see the unsplit string, e.g. "villageList "."""
+    def matches(class_attr: str | None) -> bool:
+        return class_attr is not None and class_name in class_attr.split()
+
+    return matches
+
+
+# Restrict parsing to the fragment a standalone scanner reads instead of building the whole page
+VILLAGE_LIST_STRAINER = SoupStrainer(class_=_has_class_token("villageList"))
+ACCOUNT_INFO_STRAINER = SoupStrainer(id=["sidebarBoxInfobox", "stockBar"])
+QUESTMASTER_BUTTON_STRAINER = SoupStrainer(id="questmasterButton")
+ADVERTISE_REMAINING_TIME_STRAINER = SoupStrainer(class_=_has_class_token("atg-gima-remaining-time"))
+# Everything that is not part of a number: thousands separators, bidi marks (\u202d, \u202c), units
+NON_DIGIT_PATTERN = re.compile(r'\D')
+NON_SIGNED_DIGIT_PATTERN = re.compile(r'[^\d-]')
+# Patterns applied to class strings of village center slots and resource fields
+BUILDING_GID_PATTERN = re.compile(r'g(\d+)')
+BUILDING_SLOT_PATTERN = re.compile(r'a(\d+)')
+FIELD_GID_PATTERN = re.compile(r'gid(\d+)')
+FIELD_SLOT_PATTERN = re.compile(r'buildingSlot(\d+)')
+FIELD_LEVEL_PATTERN = re.compile(r'level(\d+)')
+# Building queue item name, e.g. "Cropland Level 5"
+TARGET_LEVEL_PATTERN = re.compile(r'Level\s+(\d+)')
+# Inline script object with hourly production on dorf1
+PRODUCTION_PATTERN = re.compile(r'production:\s*({[^}]*})')
+
+@lru_cache(maxsize=None)
+def _compiled_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once; used by helpers that run for every row or slot of a page."""
+    return soupsieve.compile(selector)
+
 
 class Scanner(ScannerProtocol):
     """Scanner adapter delegating to legacy scanner module functions.
@@ -44,17 +81,26 @@ class Scanner(ScannerProtocol):
     def __init__(self, server_speed: int) -> None:
         self.speed = server_speed
 
+    def _to_soup(self, html: str | Tag, parse_only: SoupStrainer | None = None) -> Tag:
+        """Return html as a parsed tree, parsing it only if it is not one already.
+
+        Lets a caller parse a page once and hand the same tree to several scanners.
+        When a raw string has to be parsed, parse_only limits the tree to the part the scanner reads.
+        """
+        if isinstance(html, Tag):
+            return html
+        return BeautifulSoup(html or "", HTML_PARSER, parse_only=parse_only)
 
     def _parse_number_value(self, text: str) -> int:
-        cleaned = "".join(c for c in text if c.isdigit())
+        cleaned = NON_DIGIT_PATTERN.sub("", text)
         return int(cleaned) if cleaned else 0
 
 
-    def _extract_by_regex(self, pattern: str, text: str) -> str:
+    def _extract_by_regex(self, pattern: re.Pattern[str], text: str) -> str:
         """Extract the first capturing group from text using regex pattern. Raises ValueError if not found."""
-        match = re.search(pattern, text)
+        match = pattern.search(text)
         if not match or not match.groups():
-            raise ValueError(f"Pattern {pattern} not found or no capturing group in text: '{text}'")
+            raise ValueError(f"Pattern {pattern.pattern} not found or no capturing group in text: '{text}'")
         return match.group(1)
 
 
@@ -63,17 +109,17 @@ class Scanner(ScannerProtocol):
         class_str = " ".join(class_attr) if isinstance(class_attr, list) else class_attr
 
         # Extract gid (building type)
-        gid = int(self._extract_by_regex(r'g(\d+)', class_str))
+        gid = int(self._extract_by_regex(BUILDING_GID_PATTERN, class_str))
 
         # Skip empty slots (gid 0)
         if gid == 0:
             return None
 
         # Extract building slot id
-        building_id = int(self._extract_by_regex(r'a(\d+)', class_str))
+        building_id = int(self._extract_by_regex(BUILDING_SLOT_PATTERN, class_str))
 
         # Extract level from the level element
-        level_elem = slot.select_one(".labelLayer")
+        level_elem = _compiled_selector(".labelLayer").select_one(slot)
         level = int(level_elem.text) if level_elem else 0
 
         return Building(
@@ -85,7 +131,7 @@ class Scanner(ScannerProtocol):
 
     def _parse_number(self, text: str) -> int:
         text = text.strip().replace('−', '-')
-        cleaned_text = "".join(c for c in text if c.isdigit() or c == '-')
+        cleaned_text = NON_SIGNED_DIGIT_PATTERN.sub("", text)
         if not cleaned_text:
             raise ValueError(f"text {text} contains no valid number")
         return int(cleaned_text)
@@ -93,7 +139,7 @@ class Scanner(ScannerProtocol):
 
     def _extract_number(self, entry, css_class: str) -> int:
         """Extract and parse a number value from HTML element."""
-        element = entry.select_one(css_class)
+        element = _compiled_selector(css_class).select_one(entry)
         if not element:
             raise ValueError(f"Element missing {css_class}")
 
@@ -102,7 +148,7 @@ class Scanner(ScannerProtocol):
 
     def _extract_text(self, entry, css_class: str) -> str:
         """Extract text content from HTML element."""
-        elem = entry.select_one(css_class)
+        elem = _compiled_selector(css_class).select_one(entry)
         if not elem:
             raise ValueError(f"Element missing {css_class}")
         return elem.get_text().strip()
@@ -125,14 +171,14 @@ class Scanner(ScannerProtocol):
             coordinate_y=coordinate_y,
         )
 
-    def scan_village_list(self, html: str) -> list[VillageBasicInfo]:
-        """Parse village names and coordinates from HTML string."""
-        soup = BeautifulSoup(html, HTML_PARSER)
+    def scan_village_list(self, html: str | Tag) -> list[VillageBasicInfo]:
+        """Parse village names and coordinates from HTML string or an already parsed page."""
+        soup = self._to_soup(html, VILLAGE_LIST_STRAINER)
         village_entries = soup.select('.villageList .listEntry.village')
         return [self._parse_village_entry(entry) for entry in village_entries]
 
-    def scan_village_basic_info(self, html: str) -> VillageBasicInfo:
-        soup = BeautifulSoup(html, HTML_PARSER)
+    def scan_village_basic_info(self, html: str | Tag) -> VillageBasicInfo:
+        soup = self._to_soup(html, VILLAGE_LIST_STRAINER)
         active_village = soup.select_one('.villageList .listEntry.village.active')
 
         if not active_village:
@@ -147,7 +193,7 @@ class Scanner(ScannerProtocol):
         )
 
     def scan_account_info(self, html: str) -> Account:
-        soup = BeautifulSoup(html, HTML_PARSER)
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=ACCOUNT_INFO_STRAINER)
         beginners_expires = 0
 
         infobox = soup.select_one("#sidebarBoxInfobox")
@@ -155,7 +201,7 @@ class Scanner(ScannerProtocol):
 
             for li in infobox.select("ul li"):
                 text = li.get_text()
-                timer = li.select_one(".timer")
+                timer = _compiled_selector(".timer").select_one(li)
                 if timer:
                     timer_value = int(timer.get("value", "0"))
 
@@ -173,11 +219,15 @@ class Scanner(ScannerProtocol):
         )
 
     def scan_village(self, village_basic_info: VillageBasicInfo, dorf1: str, dorf2: str) -> Village:
+        # Parse each page once and share the trees between the individual scanners
+        dorf1_soup = self._to_soup(dorf1)
+        dorf2_soup = self._to_soup(dorf2)
+
         # Collect stock and production data then assemble Village with Resources model
-        stock = self.scan_stock_bar(dorf1)
+        stock = self.scan_stock_bar(dorf1_soup)
         production = self.scan_production(dorf1)
-        incoming_attacks = self.scan_incoming_attacks(dorf1)
-        troops = self.scan_troops(dorf1)
+        incoming_attacks = self.scan_incoming_attacks(dorf1_soup)
+        troops = self.scan_troops(dorf1_soup)
 
         resources = Resources(
             lumber=stock.get("lumber", 0),
@@ -186,7 +236,7 @@ class Scanner(ScannerProtocol):
             crop=stock.get("crop", 0),
         )
 
-        tribe = self.identity_tribe(dorf2)
+        tribe = self.identity_tribe(dorf2_soup)
         parallel_building_allowed = tribe in {Tribe.ROMANS, Tribe.HUNS}
         return Village(
             id=village_basic_info.id,
@@ -198,9 +248,9 @@ class Scanner(ScannerProtocol):
             tribe=tribe,
             resources=resources,
             free_crop=stock.get("free_crop", 0),
-            resource_pits=self.scan_village_source(dorf1),
-            buildings=self.scan_village_center(dorf2),
-            building_queue=self.scan_building_queue(dorf1, parallel_building_allowed),
+            resource_pits=self.scan_village_source(dorf1_soup),
+            buildings=self.scan_village_center(dorf2_soup),
+            building_queue=self.scan_building_queue(dorf1_soup, parallel_building_allowed),
             warehouse_capacity=stock.get("warehouse_capacity", 0),
             granary_capacity=stock.get("granary_capacity", 0),
             lumber_hourly_production=production.get("lumber_hourly_production", 0),
@@ -219,7 +269,7 @@ class Scanner(ScannerProtocol):
         'questmasterButton' and it contains a class 'claimable' or a child element
         with class 'newQuestSpeechBubble' (or 'bigSpeechBubble newQuestSpeechBubble').
         """
-        soup = BeautifulSoup(html, HTML_PARSER)
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=QUESTMASTER_BUTTON_STRAINER)
 
         # First, look for the questmaster button by ID
         btn = soup.select_one('#questmasterButton')
@@ -268,7 +318,7 @@ class Scanner(ScannerProtocol):
             raise ValueError("Adventure button not found")
         
         adventures = self._parse_adventure_number(adventure_button)
-        is_available = self._is_hero_available(hero_html)
+        is_available = self._is_hero_available(soup)
         inventory = self._parse_hero_inventory(inventory_html)
         points_available = self._parse_available_attribute_points(soup)
         hero_attributes = self._parse_hero_attributes(soup)
@@ -289,8 +339,8 @@ class Scanner(ScannerProtocol):
         )
 
     # Additional helpers that tests rely on — delegate to legacy implementations
-    def scan_stock_bar(self, html: str) -> dict:
-        soup = BeautifulSoup(html, HTML_PARSER)
+    def scan_stock_bar(self, html: str | Tag) -> dict:
+        soup = self._to_soup(html)
         stock_bar = soup.select_one("#stockBar")
         if not stock_bar:
             raise ValueError("Stock bar not found in HTML")
@@ -305,12 +355,13 @@ class Scanner(ScannerProtocol):
             stock_bar.select_one(".granary .capacity .value").get_text()
         )
 
-        # Parse resources
-        lumber = self._parse_number_value(stock_bar.select_one("#l1").get_text())
-        clay = self._parse_number_value(stock_bar.select_one("#l2").get_text())
-        iron = self._parse_number_value(stock_bar.select_one("#l3").get_text())
-        crop = self._parse_number_value(stock_bar.select_one("#l4").get_text())
-        free_crop = self._parse_number_value(stock_bar.select_one("#stockBarFreeCrop").get_text())
+        # Parse resources, indexing the stock bar by id once instead of searching it per value
+        values_by_id = {tag["id"]: tag for tag in stock_bar.find_all(id=True)}
+        lumber = self._parse_number_value(values_by_id["l1"].get_text())
+        clay = self._parse_number_value(values_by_id["l2"].get_text())
+        iron = self._parse_number_value(values_by_id["l3"].get_text())
+        crop = self._parse_number_value(values_by_id["l4"].get_text())
+        free_crop = self._parse_number_value(values_by_id["stockBarFreeCrop"].get_text())
 
         return {
             "lumber": lumber,
@@ -323,7 +374,7 @@ class Scanner(ScannerProtocol):
         }
 
     def scan_production(self, html: str) -> dict:
-        match = re.search(r'production:\s*({[^}]*})', html)
+        match = PRODUCTION_PATTERN.search(html)
         if not match:
             return {}
 
@@ -336,9 +387,9 @@ class Scanner(ScannerProtocol):
             "free_crop_hourly_production": prod_data.get("l5", 0),
         }
 
-    def scan_building_queue(self, html: str, parallel_building_allowed: bool) -> BuildingQueue:
+    def scan_building_queue(self, html: str | Tag, parallel_building_allowed: bool) -> BuildingQueue:
         """Scan the building queue from the current page."""
-        soup = BeautifulSoup(html, HTML_PARSER)
+        soup = self._to_soup(html)
         queue_container = soup.select_one(".buildingList")
 
         building_queue = BuildingQueue(parallel_building_allowed)
@@ -354,8 +405,8 @@ class Scanner(ScannerProtocol):
 
         return building_queue
 
-    def scan_village_source(self, html: str) -> list[ResourcePit]:
-        soup = BeautifulSoup(html, HTML_PARSER)
+    def scan_village_source(self, html: str | Tag) -> list[ResourcePit]:
+        soup = self._to_soup(html)
         container = soup.select_one("#resourceFieldContainer")
         if not container:
             raise ValueError("Resource field container not found in HTML")
@@ -371,16 +422,16 @@ class Scanner(ScannerProtocol):
             if "villageCenter" in class_str:
                 continue
 
-            gid = int(self._extract_by_regex(r'gid(\d+)', class_str))
+            gid = int(self._extract_by_regex(FIELD_GID_PATTERN, class_str))
 
             # Map gid to SourceType
-            source_type = next((st for st in ResourceType if st.gid == gid), None)
+            source_type = ResourceType.find_by_gid(gid)
 
             # Extract buildingSlot (field id)
-            field_id = int(self._extract_by_regex(r'buildingSlot(\d+)', class_str))
+            field_id = int(self._extract_by_regex(FIELD_SLOT_PATTERN, class_str))
 
             # Extract level
-            level_match = re.search(r'level(\d+)', class_str)
+            level_match = FIELD_LEVEL_PATTERN.search(class_str)
             level = int(level_match.group(1)) if level_match else 0
 
             source_pits.append(ResourcePit(
@@ -391,8 +442,8 @@ class Scanner(ScannerProtocol):
 
         return source_pits
 
-    def scan_village_center(self, html: str) -> list[Building]:
-        soup = BeautifulSoup(html, HTML_PARSER)
+    def scan_village_center(self, html: str | Tag) -> list[Building]:
+        soup = self._to_soup(html)
         container = soup.select_one("#villageContent")
         if not container:
             raise ValueError("Village container not found in HTML")
@@ -401,8 +452,8 @@ class Scanner(ScannerProtocol):
 
         return [building for slot in building_slots if (building := self._scan_building(slot))]
 
-    def identity_tribe(self, html: str) -> Tribe:
-        soup = BeautifulSoup(html, HTML_PARSER)
+    def identity_tribe(self, html: str | Tag) -> Tribe:
+        soup = self._to_soup(html)
         building_slot = soup.select_one(".buildingSlot")
         if not building_slot:
             raise ValueError("No building slot found in html to identify tribe")
@@ -428,7 +479,7 @@ class Scanner(ScannerProtocol):
         raise ValueError(f"Could not identify tribe from classes: {classes}")
 
     def _parse_adventure_number(self, adventure_button: Tag) -> int:
-        content = adventure_button.select_one('div.content')
+        content = _compiled_selector('div.content').select_one(adventure_button)
         if content is None:
             return 0
         return self._parse_number_value(content.get_text())
@@ -440,11 +491,7 @@ class Scanner(ScannerProtocol):
         an element with class `resourceWrapper` containing five `.value` spans in order:
         lumber, clay, iron, crop, cropConsumption.
         """
-        # Accept either Tag or raw HTML
-        if isinstance(html, Tag):
-            soup = html
-        else:
-            soup = BeautifulSoup(html or "", HTML_PARSER)
+        soup = self._to_soup(html)
 
         # Resource wrapper may be nested under several containers; search broadly
         resource_wrapper = soup.select_one('.inlineIconList.resourceWrapper') or soup.select_one('.resourceWrapper')
@@ -484,7 +531,7 @@ class Scanner(ScannerProtocol):
         return element.get_text().strip()
 
     def _get_item_or_raise_error(self, item: Tag, selector: str, error_message: str = None) -> Tag:
-        name_element: Tag | None = item.select_one(selector)
+        name_element: Tag | None = _compiled_selector(selector).select_one(item)
         if not name_element:
             raise ValueError(error_message or f"Element not found for selector: {selector} in item: {item}")
         return name_element
@@ -492,11 +539,11 @@ class Scanner(ScannerProtocol):
     def _extract_target_level(self, item):
         name_element = self._get_item_or_raise_error(item, ".name")
         name_text = name_element.get_text(separator=" ", strip=True)
-        level_match = re.search(r'Level\s+(\d+)', name_text)
+        level_match = TARGET_LEVEL_PATTERN.search(name_text)
         return int(level_match.group(1)) if level_match else 0
 
     def _extract_remaining_time(self, item):
-        timer_elem = item.select_one(".timer")
+        timer_elem = _compiled_selector(".timer").select_one(item)
         time_remaining = 0
         if timer_elem:
             timer_value = timer_elem.get('value')
@@ -515,9 +562,9 @@ class Scanner(ScannerProtocol):
             time_remaining=time_remaining,
         )
 
-    def _is_hero_available(self, html: str) -> bool:
+    def _is_hero_available(self, html: str | Tag) -> bool:
         """Check if hero is available for adventures."""
-        soup = BeautifulSoup(html, HTML_PARSER)
+        soup = self._to_soup(html)
         hero_state = soup.select_one(".heroState")
 
         if not hero_state:
@@ -597,11 +644,11 @@ class Scanner(ScannerProtocol):
         return indicator.get_text().strip() == '!'
 
     def _extract_building_name_from_builing_job(self, item):
-        return item.select_one('.name').text.split("Level")[0].strip()
+        return _compiled_selector('.name').select_one(item).text.split("Level")[0].strip()
 
-    def scan_incoming_attacks(self, movements_html: str) -> IncomingAttackInfo:
+    def scan_incoming_attacks(self, movements_html: str | Tag) -> IncomingAttackInfo:
         """Parse incoming attack count and the next attack timer from movements HTML."""
-        soup = BeautifulSoup(movements_html, HTML_PARSER)
+        soup = self._to_soup(movements_html)
         movements_table = soup.select_one("#movements")
         if movements_table is None:
             return IncomingAttackInfo()
@@ -610,23 +657,23 @@ class Scanner(ScannerProtocol):
         timer_value: int | None = None
 
         for row in movements_table.select("tr"):
-            attack_cell = row.select_one(".mov .a1")
+            attack_cell = _compiled_selector(".mov .a1").select_one(row)
             if attack_cell is None:
                 continue
 
             attack_text = attack_cell.get_text().strip()
             attack_count = self._parse_number_value(attack_text)
 
-            timer = row.select_one(".timer")
+            timer = _compiled_selector(".timer").select_one(row)
             if timer is not None:
                 timer_value = self._parse_number_value(timer.get("value", "0"))
             break
 
         return IncomingAttackInfo(attack_count=attack_count, next_attack_seconds=timer_value)
 
-    def scan_troops(self, html) -> dict[str, int]:
+    def scan_troops(self, html: str | Tag) -> dict[str, int]:
         """Parse troop counts from the troops overview page HTML. Returns a dict of troop type to count."""
-        soup = BeautifulSoup(html, HTML_PARSER)
+        soup = self._to_soup(html)
         troops_table = soup.select_one("#troops tbody")
 
         if not troops_table:
@@ -634,8 +681,8 @@ class Scanner(ScannerProtocol):
 
         troops = {}
         for row in troops_table.select("tr"):
-            type_cell = row.select_one(".un")
-            count_cell = row.select_one(".num")
+            type_cell = _compiled_selector(".un").select_one(row)
+            count_cell = _compiled_selector(".num").select_one(row)
 
             if type_cell and count_cell:
                 troop_type = type_cell.get_text().strip()
@@ -657,7 +704,7 @@ class Scanner(ScannerProtocol):
 
     def scan_advertise_remaining_time(self, html: str) -> int:
         """Parse the remaining time for advertisements from the HTML containing atg-gima-remaining-time."""
-        soup = BeautifulSoup(html, HTML_PARSER)
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=ADVERTISE_REMAINING_TIME_STRAINER)
         remaining_time_elem = soup.select_one(".atg-gima-remaining-time")
         if not remaining_time_elem:
             return 0
@@ -0,0 +1,9 @@
+import pytest
+
+from src.infrastructure.scan_adapter.scanner_adapter import Scanner
+
+
+@pytest.fixture(scope="session")
+def scanner() -> Scanner:
+    """Scanner is stateless apart from server speed, so one instance serves the whole session."""
+    return Scanner(server_speed=1)
@@ -1,3 +1,5 @@
+import pytest
+
 from src.domain.calculator.calculator import TravianCalculator
 from src.domain.model.model import Resources, BuildingCost
 
@@ -21,3 +23,21 @@ def test_warehouse_level_8_speed_5_mb_3():
         time_formatted="00:00:14"
     )
     assert details == expected
+
+
+@pytest.mark.parametrize("base_time, building_level, expected", [
+    (2000, 1, 2000),
+    (2000, 2, 1800),
+    (2000, 20, 280),
+    (2000, 25, 280),
+    (2000, 0, 0),
+    (1040, 1, 1040),
+    (1040, 5, 686),
+])
+def test_calculate_unit_training_time(calculator: TravianCalculator, base_time: int, building_level: int,
+                                      expected: int):
+    # When
+    training_time = calculator.calculate_unit_training_time(base_time, building_level)
+
+    # Then
+    assert training_time == expected
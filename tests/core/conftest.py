@@ -0,0 +1,38 @@
+import pytest
+
+from src.domain.calculator.calculator import TravianCalculator
+from src.domain.model.model import ResourcePit, ResourceType
+
+# (id, type, level) of the 18 resource fields of a freshly founded village
+BASE_PIT_LAYOUT: tuple[tuple[int, ResourceType, int], ...] = (
+    (1, ResourceType.LUMBER, 2),
+    (2, ResourceType.CROP, 2),
+    (3, ResourceType.CLAY, 1),
+    (4, ResourceType.LUMBER, 0),
+    (5, ResourceType.LUMBER, 0),
+    (6, ResourceType.LUMBER, 0),
+    (7, ResourceType.CLAY, 0),
+    (8, ResourceType.CLAY, 0),
+    (9, ResourceType.CLAY, 0),
+    (10, ResourceType.IRON, 0),
+    (11, ResourceType.IRON, 0),
+    (12, ResourceType.IRON, 0),
+    (13, ResourceType.IRON, 0),
+    (14, ResourceType.CROP, 0),
+    (15, ResourceType.CROP, 0),
+    (16, ResourceType.CROP, 0),
+    (17, ResourceType.CROP, 0),
+    (18, ResourceType.CROP, 0),
+)
+
+
+@pytest.fixture
+def base_pits() -> list[ResourcePit]:
+    """Resource pits of a new village; the list is stored on a mutable Village, so each test gets its own."""
+    return [ResourcePit(id=pit_id, type=pit_type, level=level) for pit_id, pit_type, level in BASE_PIT_LAYOUT]
+
+
+@pytest.fixture(scope="session")
+def calculator() -> TravianCalculator:
+    """Default calculator (version 4.4, speed 1); tests needing other settings build their own."""
+    return TravianCalculator()
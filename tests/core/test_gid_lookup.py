@@ -0,0 +1,29 @@
+import pytest
+
+from src.domain.model.model import BuildingType, ResourceType
+
+
+@pytest.mark.parametrize("gid, expected", [
+    (1, BuildingType.WOODCUTTER),
+    (4, BuildingType.CROPLAND),
+    (16, BuildingType.RALLY_POINT),
+])
+def test_building_type_from_gid(gid: int, expected: BuildingType):
+    assert BuildingType.from_gid(gid) is expected
+
+
+@pytest.mark.parametrize("gid, expected", [
+    (1, ResourceType.LUMBER),
+    (2, ResourceType.CLAY),
+    (3, ResourceType.IRON),
+    (4, ResourceType.CROP),
+])
+def test_resource_type_find_by_gid(gid: int, expected: ResourceType):
+    assert ResourceType.find_by_gid(gid) is expected
+
+
+def test_unknown_gid_raises():
+    with pytest.raises(ValueError):
+        BuildingType.from_gid(999)
+    with pytest.raises(ValueError):
+        ResourceType.find_by_gid(5)
@@ -1,13 +1,20 @@
+from dataclasses import replace
+
 import pytest
 
 from src.domain.config import LogicConfig, HeroConfig, Strategy
-from src.application.job import BuildJob
+from src.application.job import JobKind
 from src.domain.model.game_state import GameState
-from src.domain.model.model import Account, HeroInfo, Resources, Tribe, BuildingQueue, ResourcePit, ResourceType, Building, BuildingType
+from src.domain.model.model import Account, HeroInfo, Resources, Tribe, BuildingQueue, ResourcePit, Building, BuildingType
 from src.domain.model.village import Village
 from src.domain.planner.logic_engine import LogicEngine
 
 
+def with_levels(pits: list[ResourcePit], levels: dict[int, int]) -> list[ResourcePit]:
+    """Copy of pits with the level of each pit id in levels overridden."""
+    return [replace(pit, level=levels[pit.id]) if pit.id in levels else pit for pit in pits]
+
+
 @pytest.fixture
 def logic_config() -> LogicConfig:
     return LogicConfig(strategy=Strategy.DEFEND_ARMY, speed=1)
@@ -23,7 +30,7 @@ def hero_info() -> HeroInfo:
 
 
 @pytest.fixture
-def village() -> Village:
+def village(base_pits: list[ResourcePit]) -> Village:
     """Fixture for a new village with initial building configuration.
 
     Initial configuration:
@@ -39,39 +46,6 @@ def village() -> Village:
         - 5x Crop level 0 (id=13,14,15,16,17,18) - 3/hour each
     """
 
-    # Resource pits (18 fields total)
-    resource_pits = [
-        # Level 2 fields
-        ResourcePit(id=1, type=ResourceType.LUMBER, level=2),
-        ResourcePit(id=2, type=ResourceType.CROP, level=2),
-
-        # Level 1 field
-        ResourcePit(id=3, type=ResourceType.CLAY, level=1),
-
-        # Level 0 woodcutters (3 more)
-        ResourcePit(id=4, type=ResourceType.LUMBER, level=0),
-        ResourcePit(id=5, type=ResourceType.LUMBER, level=0),
-        ResourcePit(id=6, type=ResourceType.LUMBER, level=0),
-
-        # Level 0 clay pits (3 more)
-        ResourcePit(id=7, type=ResourceType.CLAY, level=0),
-        ResourcePit(id=8, type=ResourceType.CLAY, level=0),
-        ResourcePit(id=9, type=ResourceType.CLAY, level=0),
-
-        # Level 0 iron mines (4 total)
-        ResourcePit(id=10, type=ResourceType.IRON, level=0),
-        ResourcePit(id=11, type=ResourceType.IRON, level=0),
-        ResourcePit(id=12, type=ResourceType.IRON, level=0),
-        ResourcePit(id=13, type=ResourceType.IRON, level=0),
-
-        # Level 0 crops (5 more, 6 total including the level 2 one)
-        ResourcePit(id=14, type=ResourceType.CROP, level=0),
-        ResourcePit(id=15, type=ResourceType.CROP, level=0),
-        ResourcePit(id=16, type=ResourceType.CROP, level=0),
-        ResourcePit(id=17, type=ResourceType.CROP, level=0),
-        ResourcePit(id=18, type=ResourceType.CROP, level=0),
-    ]
-
     # Buildings (center)
     buildings = [
         Building(id=19, level=1, type=BuildingType.MAIN_BUILDING),
@@ -95,7 +69,7 @@ def village() -> Village:
         tribe=Tribe.GAULS,
         resources=Resources(lumber=750, clay=750, iron=750, crop=750),
         free_crop=crop_production - 6,  # -2 for base consumption
-        resource_pits=resource_pits,
+        resource_pits=base_pits,
         buildings=buildings,
         warehouse_capacity=800,
         granary_capacity=800,
@@ -118,7 +92,7 @@ def test_should_plan_1st_upgrade(logic_config: LogicConfig, hero_config: HeroCon
 
     jobs = logic_engine.plan(game_state)
 
-    build_jobs = [job for job in jobs if isinstance(job, BuildJob)]
+    build_jobs = [job for job in jobs if job.kind is JobKind.BUILD]
 
     assert len(build_jobs) == 1
 
@@ -128,32 +102,14 @@ def test_should_plan_1st_upgrade(logic_config: LogicConfig, hero_config: HeroCon
 
 
 def test_should_plan_2nd_upgrade_after_iron(logic_config: LogicConfig, hero_config: HeroConfig,
-                                            hero_info: HeroInfo, village: Village):
+                                            hero_info: HeroInfo, village: Village,
+                                            base_pits: list[ResourcePit]):
     # Iron Mine level 1 costs: lumber=100, clay=80, iron=30, crop=60
     iron_mine_cost = Resources(lumber=100, clay=80, iron=30, crop=60)
 
     # After upgrading one iron mine from level 0 to level 1
     # Level 0: 3/hour, Level 1: 7/hour -> production increase: 4/hour
-    updated_resource_pits = [
-        ResourcePit(id=1, type=ResourceType.LUMBER, level=2),
-        ResourcePit(id=2, type=ResourceType.CROP, level=2),
-        ResourcePit(id=3, type=ResourceType.CLAY, level=1),
-        ResourcePit(id=4, type=ResourceType.LUMBER, level=0),
-        ResourcePit(id=5, type=ResourceType.LUMBER, level=0),
-        ResourcePit(id=6, type=ResourceType.LUMBER, level=0),
-        ResourcePit(id=7, type=ResourceType.CLAY, level=0),
-        ResourcePit(id=8, type=ResourceType.CLAY, level=0),
-        ResourcePit(id=9, type=ResourceType.CLAY, level=0),
-        ResourcePit(id=10, type=ResourceType.IRON, level=1),  # Upgraded to level 1
-        ResourcePit(id=11, type=ResourceType.IRON, level=0),
-        ResourcePit(id=12, type=ResourceType.IRON, level=0),
-        ResourcePit(id=13, type=ResourceType.IRON, level=0),
-        ResourcePit(id=14, type=ResourceType.CROP, level=0),
-        ResourcePit(id=15, type=ResourceType.CROP, level=0),
-        ResourcePit(id=16, type=ResourceType.CROP, level=0),
-        ResourcePit(id=17, type=ResourceType.CROP, level=0),
-        ResourcePit(id=18, type=ResourceType.CROP, level=0),
-    ]
+    updated_resource_pits = with_levels(base_pits, {10: 1})  # Iron mine upgraded to level 1
 
     village_after_upgrade = Village(
         id=village.id,
@@ -182,7 +138,7 @@ def test_should_plan_2nd_upgrade_after_iron(logic_config: LogicConfig, hero_conf
 
     jobs = logic_engine.plan(game_state)
 
-    build_jobs = [job for job in jobs if isinstance(job, BuildJob)]
+    build_jobs = [job for job in jobs if job.kind is JobKind.BUILD]
 
     assert len(build_jobs) == 1
 
@@ -191,7 +147,8 @@ def test_should_plan_2nd_upgrade_after_iron(logic_config: LogicConfig, hero_conf
     assert build_job.target_level == 1
 
 def test_should_plan_3rd_upgrade_after_iron_and_woodcutter(logic_config: LogicConfig, hero_config: HeroConfig,
-                                                           hero_info: HeroInfo, village: Village):
+                                                           hero_info: HeroInfo, village: Village,
+                                                           base_pits: list[ResourcePit]):
     # First upgrade: Iron Mine level 1 costs: lumber=100, clay=80, iron=30, crop=60
     iron_mine_cost = Resources(lumber=100, clay=80, iron=30, crop=60)
 
@@ -199,26 +156,7 @@ def test_should_plan_3rd_upgrade_after_iron_and_woodcutter(logic_config: LogicCo
     woodcutter_cost = Resources(lumber=40, clay=100, iron=50, crop=60)
 
     # After upgrading both iron mine and woodcutter from level 0 to level 1
-    updated_resource_pits = [
-        ResourcePit(id=1, type=ResourceType.LUMBER, level=2),
-        ResourcePit(id=2, type=ResourceType.CROP, level=2),
-        ResourcePit(id=3, type=ResourceType.CLAY, level=1),
-        ResourcePit(id=4, type=ResourceType.LUMBER, level=1),  # Upgraded to level 1
-        ResourcePit(id=5, type=ResourceType.LUMBER, level=0),
-        ResourcePit(id=6, type=ResourceType.LUMBER, level=0),
-        ResourcePit(id=7, type=ResourceType.CLAY, level=0),
-        ResourcePit(id=8, type=ResourceType.CLAY, level=0),
-        ResourcePit(id=9, type=ResourceType.CLAY, level=0),
-        ResourcePit(id=10, type=ResourceType.IRON, level=1),  # Upgraded to level 1
-        ResourcePit(id=11, type=ResourceType.IRON, level=0),
-        ResourcePit(id=12, type=ResourceType.IRON, level=0),
-        ResourcePit(id=13, type=ResourceType.IRON, level=0),
-        ResourcePit(id=14, type=ResourceType.CROP, level=0),
-        ResourcePit(id=15, type=ResourceType.CROP, level=0),
-        ResourcePit(id=16, type=ResourceType.CROP, level=0),
-        ResourcePit(id=17, type=ResourceType.CROP, level=0),
-        ResourcePit(id=18, type=ResourceType.CROP, level=0),
-    ]
+    updated_resource_pits = with_levels(base_pits, {4: 1, 10: 1})  # Woodcutter and iron mine upgraded to level 1
 
     village_after_upgrades = Village(
         id=village.id,
@@ -247,7 +185,7 @@ def test_should_plan_3rd_upgrade_after_iron_and_woodcutter(logic_config: LogicCo
 
     jobs = logic_engine.plan(game_state)
 
-    build_jobs = [job for job in jobs if isinstance(job, BuildJob)]
+    build_jobs = [job for job in jobs if job.kind is JobKind.BUILD]
 
     assert len(build_jobs) == 1
 
@@ -256,6 +194,40 @@ def test_should_plan_3rd_upgrade_after_iron_and_woodcutter(logic_config: LogicCo
     assert build_job.target_level == 1
 
 
+def test_plan_all_batches_villages(logic_config: LogicConfig, hero_config: HeroConfig, village: Village):
+    village_low_free_crop = Village(
+        id=2,
+        name="Second Village",
+        coordinates=(1, 1),
+        tribe=village.tribe,
+        resources=Resources(lumber=500, clay=500, iron=500, crop=800),
+        free_crop=5,
+        resource_pits=village.resource_pits,
+        buildings=village.buildings,
+        warehouse_capacity=village.warehouse_capacity,
+        granary_capacity=village.granary_capacity,
+        building_queue=BuildingQueue(parallel_building_allowed=False),
+        lumber_hourly_production=village.lumber_hourly_production,
+        clay_hourly_production=village.clay_hourly_production,
+        iron_hourly_production=village.iron_hourly_production,
+        crop_hourly_production=village.crop_hourly_production,
+    )
+
+    logic_engine = LogicEngine(logic_config, hero_config)
+    game_states = [
+        GameState(account=Account(), villages=[village],
+                  hero_info=HeroInfo(health=100, experience=0, adventures=0, is_available=False)),
+        GameState(account=Account(), villages=[village_low_free_crop],
+                  hero_info=HeroInfo(health=100, experience=0, adventures=0, is_available=False)),
+    ]
+
+    planned = logic_engine.plan_all(game_states)
+
+    assert len(planned) == 2
+    build_gids = [[job.building_gid for job in jobs if job.kind is JobKind.BUILD] for jobs in planned]
+    assert build_gids == [[BuildingType.IRON_MINE.gid], [BuildingType.CROPLAND.gid]]
+
+
 def test_should_prioritize_cropland_when_low_free_crop(logic_config: LogicConfig, hero_config: HeroConfig,
                                                         hero_info: HeroInfo, village: Village):
     # Village with low resources and very low free_crop
@@ -286,7 +258,7 @@ def test_should_prioritize_cropland_when_low_free_crop(logic_config: LogicConfig
 
     jobs = logic_engine.plan(game_state)
 
-    build_jobs = [job for job in jobs if isinstance(job, BuildJob)]
+    build_jobs = [job for job in jobs if job.kind is JobKind.BUILD]
 
     assert len(build_jobs) == 1
 
@@ -296,31 +268,13 @@ def test_should_prioritize_cropland_when_low_free_crop(logic_config: LogicConfig
 
 
 def test_should_upgrade_granary_when_12h_crop_exceeds_capacity(logic_config: LogicConfig, hero_config: HeroConfig,
-                                                                hero_info: HeroInfo, village: Village):
+                                                                hero_info: HeroInfo, village: Village,
+                                                                base_pits: list[ResourcePit]):
     # Village with high crop production: 100/hour
     # 12h production: 100 * 12 = 1200
     # Granary capacity: 800 (less than 12h production)
     # All resource pits (lumber, clay, iron) at level 2 to trigger storage upgrade logic
-    updated_resource_pits = [
-        ResourcePit(id=1, type=ResourceType.LUMBER, level=2),
-        ResourcePit(id=2, type=ResourceType.CROP, level=2),
-        ResourcePit(id=3, type=ResourceType.CLAY, level=2),  # Level 2
-        ResourcePit(id=4, type=ResourceType.LUMBER, level=2),  # Level 2
-        ResourcePit(id=5, type=ResourceType.LUMBER, level=2),  # Level 2
-        ResourcePit(id=6, type=ResourceType.LUMBER, level=2),  # Level 2
-        ResourcePit(id=7, type=ResourceType.CLAY, level=2),  # Level 2
-        ResourcePit(id=8, type=ResourceType.CLAY, level=2),  # Level 2
-        ResourcePit(id=9, type=ResourceType.CLAY, level=2),  # Level 2
-        ResourcePit(id=10, type=ResourceType.IRON, level=2),  # Level 2
-        ResourcePit(id=11, type=ResourceType.IRON, level=2),  # Level 2
-        ResourcePit(id=12, type=ResourceType.IRON, level=2),  # Level 2
-        ResourcePit(id=13, type=ResourceType.IRON, level=2),  # Level 2
-        ResourcePit(id=14, type=ResourceType.CROP, level=0),  # Crops can be lower
-        ResourcePit(id=15, type=ResourceType.CROP, level=0),
-        ResourcePit(id=16, type=ResourceType.CROP, level=0),
-        ResourcePit(id=17, type=ResourceType.CROP, level=0),
-        ResourcePit(id=18, type=ResourceType.CROP, level=0),
-    ]
+    updated_resource_pits = with_levels(base_pits, {pit_id: 2 for pit_id in range(3, 14)})  # Crops can be lower
 
     village_high_crop = Village(
         id=village.id,
@@ -349,7 +303,7 @@ def test_should_upgrade_granary_when_12h_crop_exceeds_capacity(logic_config: Log
 
     jobs = logic_engine.plan(game_state)
 
-    build_jobs = [job for job in jobs if isinstance(job, BuildJob)]
+    build_jobs = [job for job in jobs if job.kind is JobKind.BUILD]
 
     assert len(build_jobs) == 1
 
@@ -360,29 +314,11 @@ def test_should_upgrade_granary_when_12h_crop_exceeds_capacity(logic_config: Log
 
 def test_should_upgrade_warehouse_when_12h_resources_exceed_capacity(logic_config: LogicConfig,
                                                                       hero_config: HeroConfig,
-                                                                      hero_info: HeroInfo, village: Village):
+                                                                      hero_info: HeroInfo, village: Village,
+                                                                      base_pits: list[ResourcePit]):
     # All resource pits (lumber, clay, iron) at level 2 to trigger storage upgrade logic
     # High lumber production: 150/hour -> 12h = 1800 > warehouse capacity 800
-    updated_resource_pits = [
-        ResourcePit(id=1, type=ResourceType.LUMBER, level=2),
-        ResourcePit(id=2, type=ResourceType.CROP, level=2),
-        ResourcePit(id=3, type=ResourceType.CLAY, level=2),  # Level 2
-        ResourcePit(id=4, type=ResourceType.LUMBER, level=2),  # Level 2
-        ResourcePit(id=5, type=ResourceType.LUMBER, level=2),  # Level 2
-        ResourcePit(id=6, type=ResourceType.LUMBER, level=2),  # Level 2
-        ResourcePit(id=7, type=ResourceType.CLAY, level=2),  # Level 2
-        ResourcePit(id=8, type=ResourceType.CLAY, level=2),  # Level 2
-        ResourcePit(id=9, type=ResourceType.CLAY, level=2),  # Level 2
-        ResourcePit(id=10, type=ResourceType.IRON, level=2),  # Level 2
-        ResourcePit(id=11, type=ResourceType.IRON, level=2),  # Level 2
-        ResourcePit(id=12, type=ResourceType.IRON, level=2),  # Level 2
-        ResourcePit(id=13, type=ResourceType.IRON, level=2),  # Level 2
-        ResourcePit(id=14, type=ResourceType.CROP, level=0),  # Crops can be lower
-        ResourcePit(id=15, type=ResourceType.CROP, level=0),
-        ResourcePit(id=16, type=ResourceType.CROP, level=0),
-        ResourcePit(id=17, type=ResourceType.CROP, level=0),
-        ResourcePit(id=18, type=ResourceType.CROP, level=0),
-    ]
+    updated_resource_pits = with_levels(base_pits, {pit_id: 2 for pit_id in range(3, 14)})  # Crops can be lower
 
     village_high_resources = Village(
         id=village.id,
@@ -411,7 +347,7 @@ def test_should_upgrade_warehouse_when_12h_resources_exceed_capacity(logic_confi
 
     jobs = logic_engine.plan(game_state)
 
-    build_jobs = [job for job in jobs if isinstance(job, BuildJob)]
+    build_jobs = [job for job in jobs if job.kind is JobKind.BUILD]
 
     assert len(build_jobs) == 1
 
@@ -0,0 +1,36 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.domain.model.model import Resources
+
+
+@pytest.mark.parametrize("available, cost, expected", [
+    (Resources(lumber=1000, clay=1000, iron=1000, crop=1000), Resources(lumber=100, clay=100, iron=100, crop=100), 10),
+    (Resources(lumber=1000, clay=1000, iron=1000, crop=150), Resources(lumber=100, clay=100, iron=100, crop=100), 1),
+    (Resources(lumber=50, clay=1000, iron=1000, crop=1000), Resources(lumber=100, clay=100, iron=100, crop=100), 0),
+    (Resources(lumber=500, clay=0, iron=0, crop=300), Resources(lumber=100, clay=0, iron=0, crop=50), 5),
+    (Resources(lumber=500, clay=500, iron=500, crop=500), Resources(), 0),
+])
+def test_count_how_many_can_be_made(available: Resources, cost: Resources, expected: int):
+    assert available.count_how_many_can_be_made(cost) == expected
+
+
+@pytest.mark.parametrize("first, second, expected", [
+    (Resources(lumber=100), Resources(clay=100), True),
+    (Resources(lumber=100, crop=5), Resources(clay=100, crop=1), False),
+    (Resources(), Resources(lumber=1, clay=1, iron=1, crop=1), True),
+])
+def test_is_disjoint(first: Resources, second: Resources, expected: bool):
+    assert first.is_disjoint(second) is expected
+
+
+def test_as_dict_keys_follow_resource_names():
+    assert Resources(lumber=1, clay=2, iron=3, crop=4).as_dict() == {"lumber": 1, "clay": 2, "iron": 3, "crop": 4}
+
+
+def test_resources_is_frozen():
+    resources = Resources(lumber=1)
+
+    with pytest.raises(FrozenInstanceError):
+        resources.lumber = 2
@@ -1,9 +1,8 @@
 from src.infrastructure.scan_adapter.scanner_adapter import Scanner
 
 
-def test_should_scan_settlers():
+def test_should_scan_settlers(scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
     html = """
            <table id="troops">
                <thead>
@@ -36,10 +35,9 @@ def test_should_scan_settlers():
     }
     assert troops == expected, f"Expected {expected} but got {troops}"
 
-def test_should_scan_no_troops():
+def test_should_scan_no_troops(scanner: Scanner):
 
     # Given
-    scanner = Scanner(server_speed=1)
     html = ""
 
     # When
@@ -0,0 +1,55 @@
+import pytest
+
+from src.domain.config import HeroConfig, LogicConfig, Strategy as StrategyType
+from src.domain.model.model import Resources, Tribe
+from src.domain.strategy.defend_army_policy import DefendArmyPolicy
+from src.domain.strategy.strategy import Strategy
+
+
+@pytest.fixture
+def strategy() -> Strategy:
+    return DefendArmyPolicy(LogicConfig(strategy=StrategyType.DEFEND_ARMY, speed=1), HeroConfig())
+
+
+@pytest.mark.parametrize("tribe, hourly_production, expected", [
+    (Tribe.GAULS, Resources(lumber=1000, clay=1300, iron=550, crop=300), {"Phalanxes": 10}),
+    (Tribe.ROMANS, Resources(lumber=250, clay=250, iron=300, crop=100), {"Legionnaire": 2}),
+    (Tribe.ROMANS, Resources(lumber=100, clay=100, iron=100, crop=100), {}),
+    (Tribe.TEUTONS, Resources(lumber=1000, clay=1000, iron=1000, crop=1000), {}),
+])
+def test_estimate_trainable_units_per_hour(strategy: Strategy, tribe: Tribe, hourly_production: Resources,
+                                           expected: dict[str, int]):
+    assert strategy.estimate_trainable_units_per_hour(tribe, hourly_production) == expected
+
+
+def test_calculate_troops_statistics_matches_per_statistic_helpers(strategy: Strategy):
+    # Given
+    troops = {"Phalanxes": 10, "Hero": 1}
+
+    # When
+    statistics = strategy.calculate_troops_statistics(Tribe.GAULS, troops)
+
+    # Then
+    assert statistics == {
+        'attack': 150,
+        'defense_infantry': 400,
+        'defense_cavalry': 500,
+        'grain_consumption': 10,
+    }
+    assert strategy.total_attack(troops, Tribe.GAULS) == statistics['attack']
+    assert strategy.total_defense_infantry(troops, Tribe.GAULS) == statistics['defense_infantry']
+    assert strategy.total_defense_cavalry(troops, Tribe.GAULS) == statistics['defense_cavalry']
+    assert strategy.grain_consumption_per_hour(troops, Tribe.GAULS) == statistics['grain_consumption']
+
+
+def test_estimate_trainable_units_per_hour_returns_read_only_result(strategy: Strategy):
+    # Given
+    hourly_production = Resources(lumber=1000, clay=1300, iron=550, crop=300)
+    trainable = strategy.estimate_trainable_units_per_hour(Tribe.GAULS, hourly_production)
+
+    # When
+    with pytest.raises(TypeError):
+        trainable["Phalanxes"] = 0
+
+    # Then
+    assert strategy.estimate_trainable_units_per_hour(Tribe.GAULS, hourly_production) == {"Phalanxes": 10}
@@ -0,0 +1,23 @@
+import pytest
+
+from src.domain.model.model import Tribe
+from src.domain.model.units import LEGIONNAIRE, PHALANXES, Unit, get_unit_by_name, get_units_for_tribe
+
+
+@pytest.mark.parametrize("tribe, expected", [
+    (Tribe.ROMANS, (LEGIONNAIRE,)),
+    (Tribe.GAULS, (PHALANXES,)),
+    (Tribe.TEUTONS, ()),
+])
+def test_get_units_for_tribe(tribe: Tribe, expected: tuple[Unit, ...]):
+    assert get_units_for_tribe(tribe) == expected
+
+
+@pytest.mark.parametrize("unit_name, tribe, expected", [
+    ("Legionnaire", Tribe.ROMANS, LEGIONNAIRE),
+    ("Phalanxes", Tribe.GAULS, PHALANXES),
+    ("Legionnaire", Tribe.GAULS, None),
+    ("Unknown", Tribe.ROMANS, None),
+])
+def test_get_unit_by_name(unit_name: str, tribe: Tribe, expected: Unit | None):
+    assert get_unit_by_name(unit_name, tribe) == expected
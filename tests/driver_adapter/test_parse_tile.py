@@ -203,6 +203,23 @@ class TestParseTile:
         assert result.x == 0
         assert result.y == 0
 
+    def test_parse_tile_null_position_defaults_to_zero(self) -> None:
+        """Test that a null position defaults coordinates to 0."""
+        tile_data = {
+            "position": None,
+            "uid": 100,
+            "did": 200,
+            "aid": 50,
+            "title": "{k.dt} Village",
+            "text": "{k.spieler} Player<br />",
+        }
+
+        result = Driver._parse_tile(tile_data)
+
+        assert isinstance(result, TileVillage)
+        assert result.x == 0
+        assert result.y == 0
+
     @pytest.mark.parametrize(
         "unit_code,expected_name",
         [
@@ -234,3 +251,25 @@ class TestParseTile:
         assert isinstance(result, TileOasisFree)
         assert result.animals == {expected_name: 5}
 
+
+    def test_parse_tiles_skips_decorative_tiles_and_keeps_order(self) -> None:
+        """Test that bulk parsing drops decorative tiles and preserves response order."""
+        tiles = [
+            {"position": {"x": 1, "y": 1}, "title": "Forest", "text": ""},
+            {"position": {"x": 2, "y": 2}, "did": -1, "title": "{k.fo}", "text": ""},
+            {"position": {"x": 3, "y": 3}, "title": "Lake", "text": ""},
+            {"position": {"x": 4, "y": 4}, "title": "{k.vt} {k.f3}", "text": ""},
+            {
+                "position": {"x": 5, "y": 5},
+                "uid": 100,
+                "did": 200,
+                "aid": 50,
+                "title": "{k.dt} Village",
+                "text": "{k.spieler} Player<br />",
+            },
+        ]
+
+        result = Driver._parse_tiles(tiles)
+
+        assert [type(tile) for tile in result] == [TileOasisFree, TileOasisOccupied, TileVillage]
+        assert [(tile.x, tile.y) for tile in result] == [(2, 2), (4, 4), (5, 5)]
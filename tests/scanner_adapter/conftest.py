@@ -0,0 +1,22 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from tests.scanner_adapter.html_utils import HtmlUtils
+
+
+@pytest.fixture(scope="session")
+def hero_attributes_soup() -> BeautifulSoup:
+    """Parsed hero_attributes.html shared by the whole session; treat it as read-only."""
+    return HtmlUtils.load_soup("hero_attributes.html")
+
+
+@pytest.fixture(scope="session")
+def dorf1_soup() -> BeautifulSoup:
+    """Parsed dorf1.html shared by the whole session; treat it as read-only."""
+    return HtmlUtils.load_soup("dorf1.html")
+
+
+@pytest.fixture(scope="session")
+def dorf2_soup() -> BeautifulSoup:
+    """Parsed dorf2.html shared by the whole session; treat it as read-only."""
+    return HtmlUtils.load_soup("dorf2.html")
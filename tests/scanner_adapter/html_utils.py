@@ -1,14 +1,28 @@
+from functools import lru_cache
 from pathlib import Path
 
+from bs4 import BeautifulSoup
+
+from src.infrastructure.scan_adapter.scanner_adapter import HTML_PARSER
+
+HTML_DIR = Path(__file__).parent
+
 
 class HtmlUtils:
     @staticmethod
+    @lru_cache(maxsize=None)
     def load(filename: str) -> str:
         """Load an HTML file from the tests/scanner_adapter directory by filename.
 
-        Returns the file content as a UTF-8 string.
+        Returns the file content as a UTF-8 string. Files are read once per session.
         """
-        test_dir = Path(__file__).parent
-        file_path = test_dir / filename
-        return file_path.read_text(encoding='utf-8')
+        return (HTML_DIR / filename).read_text(encoding='utf-8')
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def load_soup(filename: str) -> BeautifulSoup:
+        """Load and parse an HTML file, parsing it only once per session.
+
+        The returned soup is shared between tests and must be treated as read-only.
+        """
+        return BeautifulSoup(HtmlUtils.load(filename), HTML_PARSER)
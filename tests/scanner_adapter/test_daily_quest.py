@@ -1,38 +1,58 @@
+import pytest
 from bs4 import BeautifulSoup
 
-from src.infrastructure.scan_adapter.scanner_adapter import Scanner
-from tests.scanner_adapter.html_utils import HtmlUtils
+from src.infrastructure.scan_adapter.scanner_adapter import HTML_PARSER, Scanner
 
 
-def test_daily_quest_indicator_present():
-    # Given
-    html = """
+NAVIGATION_WITH_INDICATOR_HTML = """
     <div id="navigation">
         <a class="dailyQuests" href="#" accesskey="7" onclick="Travian.React.openDailyQuestsDialog(); return false;">
             <div class="indicator">!</div>
         </a>
     </div>
     """
-    soup = BeautifulSoup(html, "html.parser")
-    scanner = Scanner(server_speed=1)
+
+
+@pytest.fixture(scope="module")
+def navigation_with_indicator_soup() -> BeautifulSoup:
+    return BeautifulSoup(NAVIGATION_WITH_INDICATOR_HTML, HTML_PARSER)
+
+
+def test_daily_quest_indicator_present(scanner: Scanner, navigation_with_indicator_soup: BeautifulSoup):
+    # Given
+    nav = navigation_with_indicator_soup.select_one('#navigation')
 
     # When
-    nav = soup.select_one('#navigation')
     indicator = scanner.is_daily_quest_indicator(nav)
 
     # Then
     assert indicator is True
 
 
-def test_daily_quest_indicator_absent_in_hero_attributes():
+def test_daily_quest_indicator_absent_in_hero_attributes(scanner: Scanner, hero_attributes_soup: BeautifulSoup):
     # Given
-    html = HtmlUtils.load("hero_attributes.html")
-    soup = BeautifulSoup(html, "html.parser")
-    nav = soup.select_one('#navigation')
-    scanner = Scanner(server_speed=1)
+    nav = hero_attributes_soup.select_one('#navigation')
 
     # When
     indicator = scanner.is_daily_quest_indicator(nav)
 
     # Then
     assert indicator is False
+
+
+@pytest.mark.parametrize("indicator_html", [
+    '<div class="indicator">!</div>',
+    '<div class="indicator ">!</div>',
+    '<div class="indicator pulse">!</div>',
+    "<div class='indicator'>!</div>",
+])
+def test_daily_quest_indicator_class_variants(scanner: Scanner, indicator_html: str):
+    # Given
+    html = f'<div id="navigation"><a class="dailyQuests" href="#">{indicator_html}</a></div>'
+    nav = BeautifulSoup(html, HTML_PARSER).select_one('#navigation')
+
+    # When
+    indicator = scanner.is_daily_quest_indicator(nav)
+
+    # Then
+    assert indicator is True
@@ -4,46 +4,69 @@ from bs4 import BeautifulSoup
 from src.domain.model.model import VillageBasicInfo, ResourcePit, ResourceType, Building, BuildingType, BuildingJob, Account, \
     Tribe, HeroInfo, HeroAttributes, BuildingContract, Resources, BuildingQueue, IncomingAttackInfo
 from src.domain.model.village import Village
-from src.infrastructure.scan_adapter.scanner_adapter import Scanner
+from src.infrastructure.scan_adapter.scanner_adapter import HTML_PARSER, Scanner
 from tests.scanner_adapter.html_utils import HtmlUtils
 
 
-@pytest.fixture
+DORF1_RESOURCE_PITS = [
+    ResourcePit(id=1, type=ResourceType.LUMBER, level=8),
+    ResourcePit(id=2, type=ResourceType.CROP, level=10),
+    ResourcePit(id=3, type=ResourceType.CROP, level=0),
+    ResourcePit(id=4, type=ResourceType.LUMBER, level=5),
+    ResourcePit(id=5, type=ResourceType.CLAY, level=5),
+    ResourcePit(id=6, type=ResourceType.CLAY, level=6),
+    ResourcePit(id=7, type=ResourceType.IRON, level=5),
+    ResourcePit(id=8, type=ResourceType.CROP, level=3),
+    ResourcePit(id=9, type=ResourceType.CROP, level=5),
+    ResourcePit(id=10, type=ResourceType.IRON, level=2),
+    ResourcePit(id=11, type=ResourceType.IRON, level=5),
+    ResourcePit(id=12, type=ResourceType.CROP, level=4),
+    ResourcePit(id=13, type=ResourceType.CROP, level=5),
+    ResourcePit(id=14, type=ResourceType.LUMBER, level=8),
+    ResourcePit(id=15, type=ResourceType.CROP, level=3),
+    ResourcePit(id=16, type=ResourceType.CLAY, level=7),
+    ResourcePit(id=17, type=ResourceType.LUMBER, level=5),
+    ResourcePit(id=18, type=ResourceType.CLAY, level=9),
+]
+
+
+@pytest.fixture(scope="session")
 def dorf1_html():
     return HtmlUtils.load("dorf1.html")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dorf2_html():
     return HtmlUtils.load("dorf2.html")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def hero_attributes_html():
     return HtmlUtils.load("hero_attributes.html")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def inventory_html():
     return HtmlUtils.load("inventory.html")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def village_list_html():
     return HtmlUtils.load("upgradeBuilding.html")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def movements_html():
     return HtmlUtils.load("movements.html")
 
 
-def test_scan_village_list(dorf1_html):
+@pytest.mark.parametrize("page_fixture", ["dorf1_html", "dorf1_soup"])
+def test_scan_village_list(page_fixture: str, request: pytest.FixtureRequest, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
+    page = request.getfixturevalue(page_fixture)
 
     # When
-    result = scanner.scan_village_list(dorf1_html)
+    result = scanner.scan_village_list(page)
 
     # Then
     expected = [
@@ -53,44 +76,29 @@ def test_scan_village_list(dorf1_html):
     ]
     assert result == expected
 
-def test_scan_village_source(dorf1_html):
+def test_scan_village_source(dorf1_soup: BeautifulSoup, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
 
     # When
-    result = scanner.scan_village_source(dorf1_html)
+    result = scanner.scan_village_source(dorf1_soup)
 
     # Then
-    expected = [
-        ResourcePit(id=1, type=ResourceType.LUMBER, level=8),
-        ResourcePit(id=2, type=ResourceType.CROP, level=10),
-        ResourcePit(id=3, type=ResourceType.CROP, level=0),
-        ResourcePit(id=4, type=ResourceType.LUMBER, level=5),
-        ResourcePit(id=5, type=ResourceType.CLAY, level=5),
-        ResourcePit(id=6, type=ResourceType.CLAY, level=6),
-        ResourcePit(id=7, type=ResourceType.IRON, level=5),
-        ResourcePit(id=8, type=ResourceType.CROP, level=3),
-        ResourcePit(id=9, type=ResourceType.CROP, level=5),
-        ResourcePit(id=10, type=ResourceType.IRON, level=2),
-        ResourcePit(id=11, type=ResourceType.IRON, level=5),
-        ResourcePit(id=12, type=ResourceType.CROP, level=4),
-        ResourcePit(id=13, type=ResourceType.CROP, level=5),
-        ResourcePit(id=14, type=ResourceType.LUMBER, level=8),
-        ResourcePit(id=15, type=ResourceType.CROP, level=3),
-        ResourcePit(id=16, type=ResourceType.CLAY, level=7),
-        ResourcePit(id=17, type=ResourceType.LUMBER, level=5),
-        ResourcePit(id=18, type=ResourceType.CLAY, level=9)
-    ]
+    assert result == DORF1_RESOURCE_PITS
 
-    assert result == expected
+
+def test_scan_village_source_accepts_raw_html(dorf1_html, dorf1_soup: BeautifulSoup, scanner: Scanner):
+    # When
+    result = scanner.scan_village_source(dorf1_html)
+
+    # Then
+    assert result == scanner.scan_village_source(dorf1_soup)
 
 
-def test_scan_village_center(dorf2_html):
+def test_scan_village_center(dorf2_soup: BeautifulSoup, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
 
     # When
-    result = scanner.scan_village_center(dorf2_html)
+    result = scanner.scan_village_center(dorf2_soup)
 
     # Then
     expected = [
@@ -103,22 +111,22 @@ def test_scan_village_center(dorf2_html):
     assert result == expected
 
 
-def test_scan_village_name(dorf1_html):
+@pytest.mark.parametrize("page_fixture", ["dorf1_html", "dorf1_soup"])
+def test_scan_village_name(page_fixture: str, request: pytest.FixtureRequest, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
+    page = request.getfixturevalue(page_fixture)
 
     # When
-    result = scanner.scan_village_basic_info(dorf1_html)
+    result = scanner.scan_village_basic_info(page)
 
     # Then
     assert result == VillageBasicInfo(id=50287, name="New village", coordinate_x=2, coordinate_y=147)
 
-def test_scan_stock_bar(dorf1_html):
+def test_scan_stock_bar(dorf1_soup: BeautifulSoup, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
 
     # When
-    result = scanner.scan_stock_bar(dorf1_html)
+    result = scanner.scan_stock_bar(dorf1_soup)
 
     # Then
     expected = {
@@ -133,9 +141,8 @@ def test_scan_stock_bar(dorf1_html):
     assert result == expected
 
 
-def test_scan_production(dorf1_html):
+def test_scan_production(dorf1_html, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
 
     # When
     result = scanner.scan_production(dorf1_html)
@@ -151,9 +158,8 @@ def test_scan_production(dorf1_html):
     assert result == expected
 
 
-def test_scan_village(dorf1_html, dorf2_html):
+def test_scan_village(dorf1_html, dorf2_html, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
     identity = VillageBasicInfo(id=50287, name="New village", coordinate_x=2, coordinate_y=147)
 
     # When
@@ -173,7 +179,7 @@ def test_scan_village(dorf1_html, dorf2_html):
         clay_hourly_production=1040,
         iron_hourly_production=690,
         crop_hourly_production=1504,
-        resource_pits=result.resource_pits,
+        resource_pits=DORF1_RESOURCE_PITS,
         buildings=result.buildings,
         building_queue=result.building_queue,
         is_under_attack=False,
@@ -183,12 +189,11 @@ def test_scan_village(dorf1_html, dorf2_html):
     assert result == expected
 
 
-def test_scan_building_queue(dorf1_html):
+def test_scan_building_queue(dorf1_soup: BeautifulSoup, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
 
     # When
-    result = scanner.scan_building_queue(dorf1_html, parallel_building_allowed=True)
+    result = scanner.scan_building_queue(dorf1_soup, parallel_building_allowed=True)
 
     # Then
     expected = BuildingQueue(
@@ -210,9 +215,8 @@ def test_scan_building_queue(dorf1_html):
     assert result == expected
 
 
-def test_scan_account_info(dorf1_html):
+def test_scan_account_info(dorf1_html, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
 
     # When
     result = scanner.scan_account_info(dorf1_html)
@@ -224,20 +228,18 @@ def test_scan_account_info(dorf1_html):
     assert result == expected
 
 
-def test_identity_tribe(dorf2_html):
+def test_identity_tribe(dorf2_soup: BeautifulSoup, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
 
     # When
-    result = scanner.identity_tribe(dorf2_html)
+    result = scanner.identity_tribe(dorf2_soup)
 
     # Then
     assert result == Tribe.ROMANS
 
 
-def test_scan_hero_info(hero_attributes_html, inventory_html):
+def test_scan_hero_info(hero_attributes_html, inventory_html, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
 
     # When
     result = scanner.scan_hero_info(hero_attributes_html, inventory_html)
@@ -264,9 +266,8 @@ def test_scan_hero_info(hero_attributes_html, inventory_html):
     assert result == expected
 
 
-def test_scan_hero_info_with_attribute_points(inventory_html):
+def test_scan_hero_info_with_attribute_points(inventory_html, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
     html = HtmlUtils.load("hero_attributes_with_points.html")
 
     # When
@@ -276,54 +277,39 @@ def test_scan_hero_info_with_attribute_points(inventory_html):
     assert result.points_available == 4
 
 
-def test_scan_hero_info_without_attribute_points(hero_attributes_html, inventory_html):
+def test_scan_hero_info_without_attribute_points(hero_attributes_html, inventory_html, scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
 
     # Ensure existing fixture doesn't report attribute points
     result = scanner.scan_hero_info(hero_attributes_html, inventory_html)
     assert result.points_available == 0
 
 
-def test_scan_hero_without_adventures():
-    # Given
-    scanner = Scanner(server_speed=1)
-    html = """
-           <a id="button6977c92fb7cdd" class="layoutButton buttonFramed withIcon round adventure green    "
-              href="/hero/adventures">
-               <svg viewBox="0 0 19.75 20" class="adventure"></svg>
-           </a>
-    """
-    tag = BeautifulSoup(html, "html.parser")
+ADVENTURE_BUTTON_OPEN = (
+    '<a id="button6977c92fb7cdd" class="layoutButton buttonFramed withIcon round adventure green    " '
+    'href="/hero/adventures">'
+)
 
-    # When
-    result = scanner._parse_adventure_number(tag)
-
-    # Then
-    assert result == 0
 
-
-def test_scan_hero_with_adventures():
+@pytest.mark.parametrize("html, expected", [
+    pytest.param(ADVENTURE_BUTTON_OPEN + '<svg viewBox="0 0 19.75 20" class="adventure"></svg></a>', 0,
+                 id="without_adventures"),
+    pytest.param(ADVENTURE_BUTTON_OPEN + '<div class="content">5</div></a>', 5, id="with_adventures"),
+    pytest.param(ADVENTURE_BUTTON_OPEN + '<div class="content"> 12 </div></a>', 12, id="padded_count"),
+])
+def test_parse_adventure_number(scanner: Scanner, html: str, expected: int):
     # Given
-    scanner = Scanner(server_speed=1)
-    html = """
-           <a id="button6977c92fb7cdd" class="layoutButton buttonFramed withIcon round adventure green    "
-              href="/hero/adventures">
-               <div class="content">5</div>
-           </a>
-    """
-    tag = BeautifulSoup(html, "html.parser")
+    tag = BeautifulSoup(html, HTML_PARSER)
 
     # When
     result = scanner._parse_adventure_number(tag)
 
     # Then
-    assert result == 5
+    assert result == expected
 
 
-def test_scan_contract():
+def test_scan_contract(scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
     html = """
            <div id="contract_building10" class="buildingWrapper">
                <div class="upgradeBuilding">
@@ -355,7 +341,7 @@ def test_scan_contract():
            </div>
            """
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     tag = soup.select_one("#contract_building10")
     if tag is None:
         pytest.fail("Failed to parse test HTML for contract scanning.")
@@ -371,9 +357,8 @@ def test_scan_contract():
     assert result == expected
 
 
-def test_scan_incoming_attacks(movements_html: str) -> None:
+def test_scan_incoming_attacks(movements_html: str, scanner: Scanner) -> None:
     # Given
-    scanner = Scanner(server_speed=1)
 
     # When
     result = scanner.scan_incoming_attacks(movements_html)
@@ -381,9 +366,46 @@ def test_scan_incoming_attacks(movements_html: str) -> None:
     # Then
     assert result == IncomingAttackInfo(attack_count=1, next_attack_seconds=402)
 
-def test_scan_advertise_remaining_time():
+VILLAGE_LIST_WITH_TRAILING_SPACE_HTML = """
+    <div class="villageList ">
+        <div class="listEntry village active" data-did="50275">
+            <span class="name">SODOMA</span>
+            <span class="coordinateX">(1</span>
+            <span class="coordinateY">146)</span>
+        </div>
+    </div>
+"""
+
+
+def test_scan_village_list_matches_class_token(scanner: Scanner):
+    # When
+    result = scanner.scan_village_list(VILLAGE_LIST_WITH_TRAILING_SPACE_HTML)
+
+    # Then
+    assert result == [VillageBasicInfo(id=50275, name="SODOMA", coordinate_x=1, coordinate_y=146)]
+
+
+def test_scan_village_basic_info_matches_class_token(scanner: Scanner):
+    # When
+    result = scanner.scan_village_basic_info(VILLAGE_LIST_WITH_TRAILING_SPACE_HTML)
+
+    # Then
+    assert result == VillageBasicInfo(id=50275, name="SODOMA", coordinate_x=1, coordinate_y=146)
+
+
+def test_scan_advertise_remaining_time_with_extra_class(scanner: Scanner):
+    # Given
+    html = '<div class="atg-gima-remaining-time-wrapper"><div class="atg-gima-remaining-time active">7</div></div>'
+
+    # When
+    result = scanner.scan_advertise_remaining_time(html)
+
+    # Then
+    assert result == 7
+
+
+def test_scan_advertise_remaining_time(scanner: Scanner):
     # Given
-    scanner = Scanner(server_speed=1)
     html = """
            <div class="atg-gima-remaining-time-wrapper">
                <div class="atg-gima-remaining-time-label">Ad Counter:</div>
@@ -396,3 +418,22 @@ def test_scan_advertise_remaining_time():
 
     # Then
     assert result == 10
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("\u202d1.234\u202c", 1234),
+    ("95%", 95),
+    ("", 0),
+    ("n/a", 0),
+])
+def test_parse_number_value(scanner: Scanner, text: str, expected: int):
+    assert scanner._parse_number_value(text) == expected
+
+
+def test_scan_village_source_raises_on_unknown_field_type(scanner: Scanner):
+    # Given
+    html = '<div id="resourceFieldContainer"><a class="level resourceField gid9 buildingSlot1 level3"></a></div>'
+
+    # When
+    with pytest.raises(ValueError):
+        scanner.scan_village_source(html)